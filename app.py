@@ -5,14 +5,44 @@ import plotly.graph_objects as go
 from datetime import datetime
 import time
 import pyupbit
-from ta.momentum import RSIIndicator
-from ta.trend import MACD
+import talib
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_indicators(ticker, interval="minute15", count=100):
+    """캔들 조회 + 지표 계산 (ttl 동안 캐시 재사용)
+
+    15분봉은 900초에 한 번만 바뀌는데 화면은 5초마다 리런되므로,
+    리런마다 다시 계산하지 않고 캐시된 DataFrame을 돌려준다.
+    """
+    try:
+        df = pyupbit.get_ohlcv(ticker, interval=interval, count=count)
+        if df is None or df.empty:
+            return None
+
+        close = df['close'].values
+
+        # RSI
+        df['RSI'] = talib.RSI(close, timeperiod=14)
+
+        # MACD
+        macd, macd_signal, _ = talib.MACD(close, fastperiod=12, slowperiod=26, signalperiod=9)
+        df['MACD'] = macd
+        df['MACD_Signal'] = macd_signal
+
+        # 이동평균선
+        df['MA5'] = talib.SMA(close, timeperiod=5)
+        df['MA20'] = talib.SMA(close, timeperiod=20)
+
+        return df
+    except Exception as e:
+        st.error(f"지표 계산 중 오류 발생: {e}")
+        return None
 
 class CryptoAnalyzer:
     def __init__(self, ticker="KRW-BTC"):
         self.ticker = ticker
         self.last_signal = 0
-        
+
     def get_current_price(self):
         try:
             return pyupbit.get_current_price(self.ticker)
@@ -21,28 +51,7 @@ class CryptoAnalyzer:
             return None
 
     def calculate_indicators(self, interval="minute15", count=100):
-        try:
-            df = pyupbit.get_ohlcv(self.ticker, interval=interval, count=count)
-            if df is None or df.empty:
-                return None
-            
-            # RSI
-            rsi = RSIIndicator(close=df['close'], window=14)
-            df['RSI'] = rsi.rsi()
-            
-            # MACD
-            macd = MACD(close=df['close'])
-            df['MACD'] = macd.macd()
-            df['MACD_Signal'] = macd.macd_signal()
-            
-            # 이동평균선
-            df['MA5'] = df['close'].rolling(window=5).mean()
-            df['MA20'] = df['close'].rolling(window=20).mean()
-            
-            return df
-        except Exception as e:
-            st.error(f"지표 계산 중 오류 발생: {e}")
-            return None
+        return load_indicators(self.ticker, interval, count)
 
     def analyze_signals(self):
         current_price = self.get_current_price()
@@ -96,30 +105,43 @@ class CryptoAnalyzer:
             'indicators': latest
         }
 
-def plot_price_chart(df, ticker):
+@st.cache_resource(show_spinner=False)
+def get_base_figure(ticker):
+    """차트 골격(트레이스 + 레이아웃)을 1회만 생성"""
     fig = go.Figure()
-    
+
     # 캔들스틱
-    fig.add_trace(go.Candlestick(
-        x=df.index,
-        open=df['open'],
-        high=df['high'],
-        low=df['low'],
-        close=df['close'],
-        name='가격'
-    ))
-    
+    fig.add_trace(go.Candlestick(name='가격'))
+
     # 이동평균선
-    fig.add_trace(go.Scatter(x=df.index, y=df['MA5'], name='MA5', line=dict(color='orange')))
-    fig.add_trace(go.Scatter(x=df.index, y=df['MA20'], name='MA20', line=dict(color='blue')))
-    
+    fig.add_trace(go.Scatter(name='MA5', line=dict(color='orange')))
+    fig.add_trace(go.Scatter(name='MA20', line=dict(color='blue')))
+
     fig.update_layout(
         title=f'{ticker} 가격 차트',
         yaxis_title='가격',
         height=400,
         margin=dict(l=0, r=0, t=30, b=0)
     )
-    
+
+    return fig
+
+def plot_price_chart(df, ticker):
+    # 리런마다 Figure를 새로 만들지 않고 캐시된 골격에 데이터만 교체
+    fig = get_base_figure(ticker)
+
+    candle = fig.data[0]
+    candle.x = df.index
+    candle.open = df['open']
+    candle.high = df['high']
+    candle.low = df['low']
+    candle.close = df['close']
+
+    fig.data[1].x = df.index
+    fig.data[1].y = df['MA5']
+    fig.data[2].x = df.index
+    fig.data[2].y = df['MA20']
+
     return fig
 
 def get_signal_color(strength):
@@ -1,28 +1,286 @@
+import sys
 import time
-from datetime import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import pyupbit
+import requests
 import pandas as pd
-from ta.momentum import RSIIndicator, StochasticOscillator
-from ta.trend import MACD, ADXIndicator, IchimokuIndicator
-from ta.volume import OnBalanceVolumeIndicator, ForceIndexIndicator
+import talib
 import numpy as np
+from numba import njit, prange
+import matplotlib
+matplotlib.use('Agg')  # 백그라운드 스레드에서 파일로만 렌더링
 import matplotlib.pyplot as plt
 import mplfinance as mpf
 from playsound import playsound
+from pyarrow import feather
+from sortedcontainers import SortedList
 import os
 from pathlib import Path
+from streaming import (
+    StreamingSMA, StreamingMax, StreamingMin, StreamingRSI, StreamingMACD,
+    StreamingBBands, StreamingStoch, StreamingADX, StreamingOBV,
+    StreamingForceIndex, StreamingROC,
+)
+
+class PriceFeed:
+    """업비트 웹소켓 실시간 시세 피드
+
+    REST 폴링(재시도 + sleep) 대신 ticker 웹소켓 푸시를 백그라운드
+    스레드에서 받아 최신 체결가를 딕셔너리로 유지한다. 현재가 조회가
+    네트워크 왕복에서 딕셔너리 조회 한 번으로 바뀐다. 푸시가 끊기면
+    가격이 낡았다고 판단해 None을 돌려주고(호출부가 REST 폴백) 웹소켓을
+    재연결한다.
+    """
+
+    STALE_AFTER = 60.0  # 이 시간(초) 넘게 푸시가 없으면 낡은 가격으로 취급
+
+    def __init__(self):
+        self._prices = {}
+        self._updated = {}  # 종목별 마지막 수신 시각
+        self._codes = set()
+        self._lock = threading.Lock()
+        self._wm = None
+        self._last_restart = 0.0
+
+    def subscribe(self, ticker):
+        """종목 구독 추가 (구독 목록이 바뀌면 웹소켓 재연결)"""
+        with self._lock:
+            if ticker in self._codes:
+                return
+            self._codes.add(ticker)
+            self._restart()
+
+    def _restart(self):
+        old = self._wm
+        if old is not None:
+            try:
+                old.terminate()
+            except Exception:
+                pass
+        try:
+            self._wm = pyupbit.WebSocketManager(type="ticker", codes=list(self._codes))
+        except Exception as e:
+            print(f"웹소켓 연결 실패 (REST 폴백 사용): {e}")
+            self._wm = None
+            return
+        threading.Thread(target=self._run, args=(self._wm,), daemon=True).start()
+
+    def _run(self, wm):
+        while wm is self._wm:
+            try:
+                data = wm.get()
+                if data and 'code' in data:
+                    self._prices[data['code']] = data['trade_price']
+                    self._updated[data['code']] = time.time()
+            except Exception:
+                time.sleep(0.5)
+
+    def get(self, ticker):
+        """마지막 수신 체결가 (미수신이거나 낡았으면 None -> REST 폴백)"""
+        updated = self._updated.get(ticker)
+        if updated is None:
+            return None
+        if time.time() - updated > self.STALE_AFTER:
+            # 매니저 프로세스가 죽었거나 연결이 끊긴 경우: 재연결을 걸고
+            # 호출부는 기존 REST 경로로 현재가를 받게 한다
+            self._reconnect_if_quiet()
+            return None
+        return self._prices.get(ticker)
+
+    def _reconnect_if_quiet(self):
+        with self._lock:
+            now = time.time()
+            if now - self._last_restart < self.STALE_AFTER:
+                return  # 재연결 폭주 방지
+            self._last_restart = now
+            self._restart()
+
+
+price_feed = PriceFeed()
+
+# 캔들 캐시의 부족분 계산에 쓰는 봉 간격(초)
+_INTERVAL_SECONDS = {
+    "minute1": 60,
+    "minute3": 180,
+    "minute5": 300,
+    "minute10": 600,
+    "minute15": 900,
+    "minute30": 1800,
+    "minute60": 3600,
+    "minute240": 14400,
+    "day": 86400,
+}
+
+
+def _play_alert():
+    """알림음 재생 (디코딩/재생이 분석 루프를 막지 않도록 별도 스레드)"""
+    threading.Thread(target=playsound, args=("alert.mp3",), daemon=True).start()
+
+
+@njit(cache=True, fastmath=True)
+def _fused_rolling_row(close, high, low,
+                       ma5, ma20, ma60, ma120,
+                       bb_upper, bb_lower, roc, upper_ch, lower_ch):
+    """이동평균/볼린저/ROC/가격채널을 배열 1회 순회로 계산하는 융합 커널
+
+    pandas rolling은 컬럼마다 Series를 새로 할당하며 배열을 다시 훑지만,
+    여기서는 슬라이딩 합(평균), 슬라이딩 제곱합(표준편차), 단조 데크(채널
+    max/min)로 전부 O(n)에 한 번에 계산한다. 입력과 계산은 float64로
+    유지하고(제곱합은 float32 곱에서 이미 유효자리를 잃는다) 저장용
+    출력만 float32로 내려 읽기 대역폭을 줄인다.
+    """
+    n = close.shape[0]
+    sum5 = 0.0
+    sum20 = 0.0
+    sum60 = 0.0
+    sum120 = 0.0
+    sumsq20 = 0.0
+
+    # 단조 데크(인덱스 저장)로 rolling max/min을 상수 시간에 갱신
+    max_idx = np.empty(n, np.int64)
+    min_idx = np.empty(n, np.int64)
+    max_head = 0
+    max_tail = 0
+    min_head = 0
+    min_tail = 0
+
+    for i in range(n):
+        c = close[i]
+
+        sum5 += c
+        if i >= 5:
+            sum5 -= close[i - 5]
+        if i >= 4:
+            ma5[i] = sum5 / 5.0
+
+        sum20 += c
+        sumsq20 += c * c
+        if i >= 20:
+            old = close[i - 20]
+            sum20 -= old
+            sumsq20 -= old * old
+        if i >= 19:
+            mean20 = sum20 / 20.0
+            ma20[i] = mean20
+            var20 = sumsq20 / 20.0 - mean20 * mean20
+            if var20 < 0.0:
+                var20 = 0.0
+            std20 = np.sqrt(var20)
+            bb_upper[i] = mean20 + std20 * 2.0
+            bb_lower[i] = mean20 - std20 * 2.0
+
+        sum60 += c
+        if i >= 60:
+            sum60 -= close[i - 60]
+        if i >= 59:
+            ma60[i] = sum60 / 60.0
+
+        sum120 += c
+        if i >= 120:
+            sum120 -= close[i - 120]
+        if i >= 119:
+            ma120[i] = sum120 / 120.0
+
+        if i >= 10:
+            roc[i] = (c / close[i - 10] - 1.0) * 100.0
+
+        while max_tail > max_head and high[max_idx[max_tail - 1]] <= high[i]:
+            max_tail -= 1
+        max_idx[max_tail] = i
+        max_tail += 1
+        if max_idx[max_head] <= i - 20:
+            max_head += 1
+        while min_tail > min_head and low[min_idx[min_tail - 1]] >= low[i]:
+            min_tail -= 1
+        min_idx[min_tail] = i
+        min_tail += 1
+        if min_idx[min_head] <= i - 20:
+            min_head += 1
+        if i >= 19:
+            upper_ch[i] = high[max_idx[max_head]]
+            lower_ch[i] = low[min_idx[min_head]]
+
+
+@njit(cache=True, fastmath=True)
+def _fused_rolling(close, high, low):
+    """단일 티커용: 출력 9개를 할당해 융합 커널을 한 번 호출"""
+    n = close.shape[0]
+    out = np.full((9, n), np.nan, np.float32)
+    _fused_rolling_row(close, high, low,
+                       out[0], out[1], out[2], out[3],
+                       out[4], out[5], out[6], out[7], out[8])
+    return out[0], out[1], out[2], out[3], out[4], out[5], out[6], out[7], out[8]
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _fused_rolling_batch(closes, highs, lows):
+    """배치용: (티커 수 x 봉 수) 2-D 배열을 티커 축으로 병렬 순회
+
+    티커마다 파이썬에서 커널을 따로 호출하는 대신 SoA로 쌓아 prange 한
+    번에 계산한다. 반환 shape은 (티커 수, 9, 봉 수).
+    """
+    n_tickers, n = closes.shape
+    out = np.full((n_tickers, 9, n), np.nan, np.float32)
+    for t in prange(n_tickers):
+        _fused_rolling_row(closes[t], highs[t], lows[t],
+                           out[t, 0], out[t, 1], out[t, 2], out[t, 3],
+                           out[t, 4], out[t, 5], out[t, 6], out[t, 7], out[t, 8])
+    return out
+
+
+# 시그널 규칙: 조건 벡터와 같은 순서의 메시지/가중치 테이블
+_SIGNAL_MESSAGES = (
+    " RSI 과매도 구간 (매수 시그널)",
+    " RSI 과매수 구간 (매도 시그널)",
+    " MACD 상승 추세 강화",
+    " MACD 상승 추세",
+    " MACD 하락 추세 강화",
+    " MACD 하락 추세",
+    " 이동평균선 황금 크로스",
+    " 이동평균선 데드 크로스",
+    " 볼린저 밴드 하단 돌파 (매수 시그널)",
+    " 볼린저 밴드 상단 돌파 (매도 시그널)",
+    " 스토캐스틱 과매도 반등 시그널",
+    " 스토캐스틱 과매수 하락 시그널",
+    " DMI 강력 상승 트렌드",
+    " DMI 강력 하락 트렌드",
+    " OBV 상승 트렌드 (매수세 우위)",
+    " OBV 하락 트렌드 (매도세 우위)",
+    " 일목균형표 상승 시그널",
+    " 일목균형표 하락 시그널",
+    " ROC 강력 상승 모멘텀",
+    " ROC 강력 하락 모멘텀",
+    " 상단 채널 돌파 (상승 추세 강화)",
+    " 하단 채널 돌파 (하락 추세 강화)",
+)
+_SIGNAL_WEIGHTS = np.array(
+    [1, -1, 1, 0, -1, 0, 1, -1, 1, -1, 1, -1, 1, -1, 1, -1, 1, -1, 1, -1, 1, -1],
+    dtype=np.int8)
+
 
 class CryptoAnalyzer:
     def __init__(self, ticker="KRW-BTC"):
         self.ticker = ticker
-        self.price_alerts = {}  # 가격 알림 설정
+        # 가격 알림: 방향별 정렬 리스트 (현재가가 넘은 구간만 잘라서 확인)
+        self._above_alerts = SortedList()
+        self._below_alerts = SortedList()
         self.last_volume = None  # 이전 거래량
         self.volume_alert_threshold = 2.0  # 거래량 급증 기준 (200%)
         self.chart_dir = "charts"  # 차트 저장 디렉토리
         Path(self.chart_dir).mkdir(exist_ok=True)
+        self.cache_dir = "cache"  # 캔들 디스크 캐시 디렉토리
+        Path(self.cache_dir).mkdir(exist_ok=True)
+        self.df = None  # 지표가 채워진 봉 버퍼 (최근 200개 유지)
+        self._streams = None  # 스트리밍 지표 상태
+        self._last_chart_ts = 0.0  # 마지막 차트 렌더링 시각
+        price_feed.subscribe(ticker)
 
     def get_current_price(self):
-        """현재가 조회"""
+        """현재가 조회 (웹소켓 피드 우선, 미수신 시 REST 폴백)"""
+        price = price_feed.get(self.ticker)
+        if price is not None:
+            return price
         try:
             price = None
             for _ in range(3):  # 최대 3번 재시도
@@ -40,24 +298,25 @@ class CryptoAnalyzer:
 
     def set_price_alert(self, target_price, alert_type="above"):
         """가격 알림 설정"""
-        self.price_alerts[target_price] = alert_type
+        if alert_type == "above":
+            self._above_alerts.add(target_price)
+        else:
+            self._below_alerts.add(target_price)
         print(f"{self.ticker} {target_price:,}원 {alert_type} 알림 설정 완료")
 
     def check_price_alerts(self, current_price):
-        """가격 알림 체크"""
-        alerts_to_remove = []
-        for target_price, alert_type in self.price_alerts.items():
-            if alert_type == "above" and current_price > target_price:
-                print(f"\n {self.ticker} 가격이 {target_price:,}원을 돌파했습니다!")
-                playsound("alert.mp3")
-                alerts_to_remove.append(target_price)
-            elif alert_type == "below" and current_price < target_price:
-                print(f"\n {self.ticker} 가격이 {target_price:,}원 아래로 떨어졌습니다!")
-                playsound("alert.mp3")
-                alerts_to_remove.append(target_price)
-        
-        for price in alerts_to_remove:
-            del self.price_alerts[price]
+        """가격 알림 체크 (이진 탐색으로 현재가가 넘은 구간만 스캔)"""
+        idx = self._above_alerts.bisect_left(current_price)
+        for target_price in self._above_alerts[:idx]:
+            print(f"\n {self.ticker} 가격이 {target_price:,}원을 돌파했습니다!")
+            _play_alert()
+        del self._above_alerts[:idx]
+
+        idx = self._below_alerts.bisect_right(current_price)
+        for target_price in self._below_alerts[idx:]:
+            print(f"\n {self.ticker} 가격이 {target_price:,}원 아래로 떨어졌습니다!")
+            _play_alert()
+        del self._below_alerts[idx:]
 
     def check_volume_surge(self, df):
         """거래량 급증 체크"""
@@ -69,12 +328,12 @@ class CryptoAnalyzer:
             volume_change = current_volume / self.last_volume
             if volume_change > self.volume_alert_threshold:
                 print(f"\n {self.ticker} 거래량 급증! ({volume_change:.1f}배)")
-                playsound("alert.mp3")
+                _play_alert()
         
         self.last_volume = current_volume
 
-    def plot_chart(self, df):
-        """차트 그리기"""
+    def plot_chart(self, df, stamp):
+        """차트 그리기 (파일명 타임스탬프는 호출부에서 받아 strftime 중복 방지)"""
         if df is None or len(df) < 60:
             return
         
@@ -97,7 +356,7 @@ class CryptoAnalyzer:
             mpf.make_addplot(df['Ichimoku_SpanB'], color='green', alpha=0.3)
         ]
         
-        chart_file = f"{self.chart_dir}/{self.ticker}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
+        chart_file = f"{self.chart_dir}/{self.ticker}_{stamp}.png"
         fig, axes = mpf.plot(
             df,
             type='candle',
@@ -108,8 +367,8 @@ class CryptoAnalyzer:
             title=f'\n{self.ticker} Technical Analysis\n',
             figsize=(15, 10)
         )
-        plt.savefig(chart_file)
-        plt.close()
+        fig.savefig(chart_file, dpi=72)
+        plt.close(fig)
         
         print(f"차트 저장됨: {chart_file}")
 
@@ -128,75 +387,264 @@ class CryptoAnalyzer:
             
             if df is None or df.empty:
                 return None
-            
+
+            return self._compute_indicators(df)
+        except Exception as e:
+            print(f"지표 계산 중 오류 발생: {e}")
+            return None
+
+    def _compute_indicators(self, df, rolled=None):
+        """받아 둔 OHLCV에 지표 컬럼을 붙여서 반환
+
+        rolled에 _fused_rolling_batch가 만든 (9 x 봉 수) 블록을 넘기면
+        융합 커널 호출을 건너뛴다 (여러 티커 일괄 워밍업 경로).
+        """
+        try:
+            # pandas <-> numpy 왕복 복사를 피하려고 float64 배열을 한 번만 추출
+            high = df['high'].to_numpy(np.float64, copy=False)
+            low = df['low'].to_numpy(np.float64, copy=False)
+            close = df['close'].to_numpy(np.float64, copy=False)
+            volume = df['volume'].to_numpy(np.float64, copy=False)
+
+            # 지표는 전부 ndarray로 계산해 두고 마지막에 한 번에 DataFrame으로 합친다
+            ind = {}
+
             # RSI
-            rsi = RSIIndicator(close=df['close'], window=14)
-            df['RSI'] = rsi.rsi()
-            
+            ind['RSI'] = talib.RSI(close, timeperiod=14)
+
             # MACD
-            macd = MACD(close=df['close'])
-            df['MACD'] = macd.macd()
-            df['MACD_Signal'] = macd.macd_signal()
-            df['MACD_Hist'] = macd.macd_diff()
-            
+            macd, macd_signal, macd_hist = talib.MACD(close, fastperiod=12, slowperiod=26, signalperiod=9)
+            ind['MACD'] = macd
+            ind['MACD_Signal'] = macd_signal
+            ind['MACD_Hist'] = macd_hist
+
             # Stochastic
-            stoch = StochasticOscillator(high=df['high'], low=df['low'], close=df['close'], window=14, smooth_window=3)
-            df['Stoch_K'] = stoch.stoch()
-            df['Stoch_D'] = stoch.stoch_signal()
-            
+            stoch_k, stoch_d = talib.STOCH(high, low, close,
+                                           fastk_period=14, slowk_period=3, slowk_matype=0,
+                                           slowd_period=3, slowd_matype=0)
+            ind['Stoch_K'] = stoch_k
+            ind['Stoch_D'] = stoch_d
+
             # DMI (Directional Movement Index)
-            adx = ADXIndicator(high=df['high'], low=df['low'], close=df['close'], window=14)
-            df['ADX'] = adx.adx()
-            df['DI_plus'] = adx.adx_pos()
-            df['DI_minus'] = adx.adx_neg()
-            
+            ind['ADX'] = talib.ADX(high, low, close, timeperiod=14)
+            ind['DI_plus'] = talib.PLUS_DI(high, low, close, timeperiod=14)
+            ind['DI_minus'] = talib.MINUS_DI(high, low, close, timeperiod=14)
+
             # OBV (On Balance Volume)
-            obv = OnBalanceVolumeIndicator(close=df['close'], volume=df['volume'])
-            df['OBV'] = obv.on_balance_volume()
-            
-            # Force Index
-            fi = ForceIndexIndicator(close=df['close'], volume=df['volume'])
-            df['Force_Index'] = fi.force_index()
-            
+            obv = talib.OBV(close, volume)
+            ind['OBV'] = obv
+            ind['OBV_MA'] = talib.SMA(obv, timeperiod=20)
+
+            # Force Index (종가 변화량 x 거래량의 13기간 EMA)
+            ind['Force_Index'] = talib.EMA(np.diff(close, prepend=np.nan) * volume, timeperiod=13)
+
             # 일목균형표
-            ichimoku = IchimokuIndicator(high=df['high'], low=df['low'])
-            df['Ichimoku_Conversion'] = ichimoku.ichimoku_conversion_line()
-            df['Ichimoku_Base'] = ichimoku.ichimoku_base_line()
-            df['Ichimoku_SpanA'] = ichimoku.ichimoku_a()
-            df['Ichimoku_SpanB'] = ichimoku.ichimoku_b()
-            
-            # 이동평균선
-            df['MA5'] = df['close'].rolling(window=5).mean()
-            df['MA20'] = df['close'].rolling(window=20).mean()
-            df['MA60'] = df['close'].rolling(window=60).mean()
-            df['MA120'] = df['close'].rolling(window=120).mean()
-            
-            # 볼린저 밴드
-            df['BB_Middle'] = df['close'].rolling(window=20).mean()
-            std = df['close'].rolling(window=20).std()
-            df['BB_Upper'] = df['BB_Middle'] + (std * 2)
-            df['BB_Lower'] = df['BB_Middle'] - (std * 2)
-            
-            # 추가 모멘텀 지표
-            # ROC (Rate of Change)
-            df['ROC'] = df['close'].pct_change(periods=10) * 100
-            
-            # Price Channel
-            df['Upper_Channel'] = df['high'].rolling(window=20).max()
-            df['Lower_Channel'] = df['low'].rolling(window=20).min()
-            
-            return df
+            conversion = (talib.MAX(high, timeperiod=9) + talib.MIN(low, timeperiod=9)) / 2
+            base = (talib.MAX(high, timeperiod=26) + talib.MIN(low, timeperiod=26)) / 2
+            ind['Ichimoku_Conversion'] = conversion
+            ind['Ichimoku_Base'] = base
+            ind['Ichimoku_SpanA'] = (conversion + base) / 2
+            ind['Ichimoku_SpanB'] = (talib.MAX(high, timeperiod=52) + talib.MIN(low, timeperiod=52)) / 2
+
+            # 이동평균선/볼린저 밴드/ROC/Price Channel: 융합 커널로 1회 순회 계산
+            # (입력은 float64 그대로 — 가격 스케일에서 float32 제곱은 분산을 망가뜨린다)
+            if rolled is None:
+                rolled = _fused_rolling(close, high, low)
+            ma5, ma20, ma60, ma120, bb_upper, bb_lower, roc, upper_ch, lower_ch = rolled
+            ind['MA5'] = ma5
+            ind['MA20'] = ma20
+            ind['MA60'] = ma60
+            ind['MA120'] = ma120
+            ind['BB_Middle'] = ma20
+            ind['BB_Upper'] = bb_upper
+            ind['BB_Lower'] = bb_lower
+            ind['ROC'] = roc
+            ind['Upper_Channel'] = upper_ch
+            ind['Lower_Channel'] = lower_ch
+
+            # 지표 컬럼은 float32로 저장해 이후 읽기 대역폭을 절반으로 줄인다
+            # (OBV/Force Index는 거래량 누적 스케일이라 float64 유지)
+            for name, arr in ind.items():
+                if name not in ('OBV', 'OBV_MA', 'Force_Index') and arr.dtype != np.float32:
+                    ind[name] = arr.astype(np.float32)
+
+            # 인덱스가 같으므로 정렬 없이 블록 단위로 한 번만 합친다
+            ind_df = pd.DataFrame(ind, index=df.index, copy=False)
+            return pd.concat([df, ind_df], axis=1, copy=False)
         except Exception as e:
             print(f"지표 계산 중 오류 발생: {e}")
             return None
 
+    def _build_streams(self):
+        """스트리밍 지표 상태 초기화"""
+        self._streams = {
+            'rsi': StreamingRSI(14),
+            'macd': StreamingMACD(12, 26, 9),
+            'stoch': StreamingStoch(14, 3, 3),
+            'adx': StreamingADX(14),
+            'obv': StreamingOBV(),
+            'obv_ma': StreamingSMA(20),
+            'force': StreamingForceIndex(13),
+            'ma5': StreamingSMA(5),
+            'ma20': StreamingSMA(20),
+            'ma60': StreamingSMA(60),
+            'ma120': StreamingSMA(120),
+            'bb': StreamingBBands(20, 2),
+            'roc': StreamingROC(10),
+            'upper_ch': StreamingMax(20),
+            'lower_ch': StreamingMin(20),
+            'conv_max': StreamingMax(9),
+            'conv_min': StreamingMin(9),
+            'base_max': StreamingMax(26),
+            'base_min': StreamingMin(26),
+            'spanb_max': StreamingMax(52),
+            'spanb_min': StreamingMin(52),
+        }
+
+    def _update_streams(self, high, low, close, volume):
+        """봉 하나를 모든 스트리밍 지표에 O(1)로 반영하고 최신 값을 반환"""
+        s = self._streams
+        macd, macd_signal, macd_hist = s['macd'].update(close)
+        stoch_k, stoch_d = s['stoch'].update(high, low, close)
+        adx, di_plus, di_minus = s['adx'].update(high, low, close)
+        bb_middle, bb_upper, bb_lower = s['bb'].update(close)
+        obv = s['obv'].update(close, volume)
+        conversion = (s['conv_max'].update(high) + s['conv_min'].update(low)) / 2
+        base = (s['base_max'].update(high) + s['base_min'].update(low)) / 2
+        return {
+            'RSI': s['rsi'].update(close),
+            'MACD': macd,
+            'MACD_Signal': macd_signal,
+            'MACD_Hist': macd_hist,
+            'Stoch_K': stoch_k,
+            'Stoch_D': stoch_d,
+            'ADX': adx,
+            'DI_plus': di_plus,
+            'DI_minus': di_minus,
+            'OBV': obv,
+            'OBV_MA': s['obv_ma'].update(obv),
+            'Force_Index': s['force'].update(close, volume),
+            'Ichimoku_Conversion': conversion,
+            'Ichimoku_Base': base,
+            'Ichimoku_SpanA': (conversion + base) / 2,
+            'Ichimoku_SpanB': (s['spanb_max'].update(high) + s['spanb_min'].update(low)) / 2,
+            'MA5': s['ma5'].update(close),
+            'MA20': s['ma20'].update(close),
+            'MA60': s['ma60'].update(close),
+            'MA120': s['ma120'].update(close),
+            'BB_Middle': bb_middle,
+            'BB_Upper': bb_upper,
+            'BB_Lower': bb_lower,
+            'ROC': s['roc'].update(close),
+            'Upper_Channel': s['upper_ch'].update(high),
+            'Lower_Channel': s['lower_ch'].update(low),
+        }
+
+    def _cache_path(self, interval):
+        return f"{self.cache_dir}/{self.ticker}_{interval}.feather"
+
+    def _save_ohlcv_cache(self, df, interval):
+        """원시 봉만 디스크 링 버퍼(feather)로 유지 (최근 500개)"""
+        try:
+            raw_cols = [c for c in ('open', 'high', 'low', 'close', 'volume', 'value')
+                        if c in df.columns]
+            feather.write_feather(df[raw_cols].tail(500).reset_index(), self._cache_path(interval))
+        except Exception as e:
+            print(f"{self.ticker} 캔들 캐시 저장 중 오류 발생: {e}")
+
+    def _load_cached_ohlcv(self, interval, count):
+        """디스크 캐시에서 봉을 읽고 마지막 저장 이후 부족분만 REST로 요청"""
+        step = _INTERVAL_SECONDS.get(interval)
+        path = self._cache_path(interval)
+        if step is None or not os.path.exists(path):
+            return None
+        try:
+            cached = feather.read_feather(path).set_index('index')
+            # pyupbit 타임스탬프는 KST 기준 naive라 현재 시각도 KST로 맞춘다
+            now_kst = pd.Timestamp.now(tz="Asia/Seoul").tz_localize(None)
+            missing = int((now_kst - cached.index[-1]).total_seconds() // step) + 1
+            if missing < 1:
+                return None
+            if missing >= count:
+                return None  # 캐시가 너무 오래됨: 전체를 다시 받는다
+            new = pyupbit.get_ohlcv(self.ticker, interval=interval, count=missing)
+            if new is None or new.empty:
+                return None
+            df = pd.concat([cached[cached.index < new.index[0]], new])
+            if len(df) < count:
+                return None
+            return df.iloc[-count:]
+        except Exception as e:
+            print(f"{self.ticker} 캔들 캐시 로드 중 오류 발생: {e}")
+            return None
+
+    def _warmup(self, interval="minute60", count=200, df=None, rolled=None):
+        """최초 1회만 전체 봉을 받아 일괄 계산하고 스트림 상태를 시딩
+
+        df/rolled가 주어지면 이미 받아 둔 봉과 배치 커널 결과를 재사용한다
+        (warmup_analyzers의 여러 티커 일괄 경로).
+        """
+        if df is None:
+            # 디스크 캐시가 살아 있으면 부족분만 받아서 콜드 스타트를 줄인다
+            raw = self._load_cached_ohlcv(interval, count)
+            if raw is not None:
+                df = self._compute_indicators(raw)
+            else:
+                df = self.calculate_indicators(interval=interval, count=count)
+        else:
+            df = self._compute_indicators(df, rolled)
+        if df is None:
+            return None
+        # 업비트 REST의 마지막 봉은 아직 진행 중인 스냅샷이므로 버퍼/스트림에는
+        # 확정된 봉만 남긴다 (진행 중 봉을 먹이면 고저가/거래량이 영구히 왜곡됨)
+        df = df.iloc[:-1]
+        self._save_ohlcv_cache(df, interval)
+        self._build_streams()
+        high = df['high'].values
+        low = df['low'].values
+        close = df['close'].values
+        volume = df['volume'].values
+        for i in range(len(df)):
+            self._update_streams(high[i], low[i], close[i], volume[i])
+        self.df = df
+        return df
+
+    def _refresh_streaming(self, interval="minute60"):
+        """새 봉이 확정된 경우에만 스트리밍 갱신 (없으면 기존 버퍼 그대로)
+
+        count=2로 받아 끝에서 두 번째(확정) 봉만 스트림에 반영한다.
+        마지막 봉은 진행 중 스냅샷이라 지표 상태에 넣지 않는다.
+        """
+        try:
+            latest_bars = pyupbit.get_ohlcv(self.ticker, interval=interval, count=2)
+            if latest_bars is None or len(latest_bars) < 2:
+                return self.df
+            ts = latest_bars.index[-2]
+            if ts <= self.df.index[-1]:
+                return self.df
+            closed = latest_bars.iloc[-2]
+            values = self._update_streams(closed['high'], closed['low'], closed['close'], closed['volume'])
+            values.update(closed.to_dict())
+            self.df.loc[ts] = pd.Series(values)
+            if len(self.df) > 200:  # 원형 버퍼처럼 최근 200개만 유지
+                self.df = self.df.iloc[-200:]
+            self._save_ohlcv_cache(self.df, interval)
+            return self.df
+        except Exception as e:
+            print(f"{self.ticker} 스트리밍 갱신 중 오류 발생: {e}")
+            return self.df
+
     def analyze_signals(self):
         """매수/매도 시그널 분석"""
         current_price = self.get_current_price()
         if current_price is None:
             return None
-        
-        df = self.calculate_indicators()
+
+        # 최초에만 전체 재계산, 이후에는 새 봉만 O(1) 반영
+        if self.df is None:
+            df = self._warmup()
+        else:
+            df = self._refresh_streaming()
         if df is None or len(df) < 60:
             return None
         
@@ -206,272 +654,248 @@ class CryptoAnalyzer:
         # 가격 알림 체크
         self.check_price_alerts(current_price)
         
-        # 차트 생성 (1분마다)
-        if datetime.now().second < 15:
-            self.plot_chart(df)
-        
-        latest = df.iloc[-1]
-        signals = []
-        signal_strength = 0
-        
+        # 차트 생성 (5분에 한 번, 분석 루프를 막지 않도록 백그라운드 렌더링)
+        now = time.time()
+        if now - self._last_chart_ts > 300:
+            self._last_chart_ts = now
+            stamp = time.strftime('%Y%m%d_%H%M%S', time.localtime(now))
+            threading.Thread(target=self.plot_chart, args=(df.copy(), stamp), daemon=True).start()
+        
+        # Series 라벨 조회 대신 ndarray에서 바로 스칼라를 읽는다
+        cols = {name: df[name].to_numpy() for name in (
+            'close', 'RSI', 'MACD', 'MACD_Signal', 'MACD_Hist',
+            'MA5', 'MA20', 'MA60', 'BB_Upper', 'BB_Lower',
+            'Stoch_K', 'Stoch_D', 'ADX', 'DI_plus', 'DI_minus', 'OBV', 'OBV_MA',
+            'Ichimoku_SpanA', 'Ichimoku_SpanB', 'ROC',
+            'Upper_Channel', 'Lower_Channel')}
+
         result = {
             'ticker': self.ticker,
             'current_price': current_price,
             'signals': [],
             'signal_strength': 0,
-            'rsi': latest['RSI'],
-            'ma5': latest['MA5'],
-            'ma20': latest['MA20'],
-            'ma60': latest['MA60'],
-            'Stoch_K': latest['Stoch_K'],
-            'Stoch_D': latest['Stoch_D'],
-            'ADX': latest['ADX'],
-            'DI_plus': latest['DI_plus'],
-            'DI_minus': latest['DI_minus'],
-            'OBV': latest['OBV']
+            'rsi': float(cols['RSI'][-1]),
+            'ma5': float(cols['MA5'][-1]),
+            'ma20': float(cols['MA20'][-1]),
+            'ma60': float(cols['MA60'][-1]),
+            'Stoch_K': float(cols['Stoch_K'][-1]),
+            'Stoch_D': float(cols['Stoch_D'][-1]),
+            'ADX': float(cols['ADX'][-1]),
+            'DI_plus': float(cols['DI_plus'][-1]),
+            'DI_minus': float(cols['DI_minus'][-1]),
+            'OBV': float(cols['OBV'][-1])
         }
         
-        if latest['RSI'] < 30:
-            signals.append(" RSI 과매도 구간 (매수 시그널)")
-            signal_strength += 1
-        elif latest['RSI'] > 70:
-            signals.append(" RSI 과매수 구간 (매도 시그널)")
-            signal_strength -= 1
-        
-        if latest['MACD'] > latest['MACD_Signal']:
-            if latest['MACD_Hist'] > df['MACD_Hist'].iloc[-2]:
-                signals.append(" MACD 상승 추세 강화")
-                signal_strength += 1
-            else:
-                signals.append(" MACD 상승 추세")
-        else:
-            if latest['MACD_Hist'] < df['MACD_Hist'].iloc[-2]:
-                signals.append(" MACD 하락 추세 강화")
-                signal_strength -= 1
-            else:
-                signals.append(" MACD 하락 추세")
-        
-        if latest['MA5'] > latest['MA20'] > latest['MA60']:
-            signals.append(" 이동평균선 황금 크로스")
-            signal_strength += 1
-        elif latest['MA5'] < latest['MA20'] < latest['MA60']:
-            signals.append(" 이동평균선 데드 크로스")
-            signal_strength -= 1
-        
-        if current_price < latest['BB_Lower']:
-            signals.append(" 볼린저 밴드 하단 돌파 (매수 시그널)")
-            signal_strength += 1
-        elif current_price > latest['BB_Upper']:
-            signals.append(" 볼린저 밴드 상단 돌파 (매도 시그널)")
-            signal_strength -= 1
-        
-        # Stochastic 분석
-        if latest['Stoch_K'] < 20 and latest['Stoch_K'] > latest['Stoch_D']:
-            signals.append(" 스토캐스틱 과매도 반등 시그널")
-            signal_strength += 1
-        elif latest['Stoch_K'] > 80 and latest['Stoch_K'] < latest['Stoch_D']:
-            signals.append(" 스토캐스틱 과매수 하락 시그널")
-            signal_strength -= 1
-        
-        # DMI 분석
-        if latest['DI_plus'] > latest['DI_minus'] and latest['ADX'] > 25:
-            signals.append(" DMI 강력 상승 트렌드")
-            signal_strength += 1
-        elif latest['DI_minus'] > latest['DI_plus'] and latest['ADX'] > 25:
-            signals.append(" DMI 강력 하락 트렌드")
-            signal_strength -= 1
-        
-        # OBV 분석
-        obv_ma = df['OBV'].rolling(window=20).mean()
-        if latest['OBV'] > obv_ma.iloc[-1]:
-            signals.append(" OBV 상승 트렌드 (매수세 우위)")
-            signal_strength += 1
-        elif latest['OBV'] < obv_ma.iloc[-1]:
-            signals.append(" OBV 하락 트렌드 (매도세 우위)")
-            signal_strength -= 1
-        
-        # 일목균형표 분석
-        if (latest['close'] > latest['Ichimoku_SpanA'] and 
-            latest['close'] > latest['Ichimoku_SpanB']):
-            signals.append(" 일목균형표 상승 시그널")
-            signal_strength += 1
-        elif (latest['close'] < latest['Ichimoku_SpanA'] and 
-              latest['close'] < latest['Ichimoku_SpanB']):
-            signals.append(" 일목균형표 하락 시그널")
-            signal_strength -= 1
-        
-        # ROC 분석
-        if latest['ROC'] > 5:
-            signals.append(" ROC 강력 상승 모멘텀")
-            signal_strength += 1
-        elif latest['ROC'] < -5:
-            signals.append(" ROC 강력 하락 모멘텀")
-            signal_strength -= 1
-        
-        # Price Channel 분석
-        if current_price >= latest['Upper_Channel']:
-            signals.append(" 상단 채널 돌파 (상승 추세 강화)")
-            signal_strength += 1
-        elif current_price <= latest['Lower_Channel']:
-            signals.append(" 하단 채널 돌파 (하락 추세 강화)")
-            signal_strength -= 1
-        
-        result['signals'] = signals
-        result['signal_strength'] = signal_strength
+        rsi = cols['RSI'][-1]
+        macd_up = cols['MACD'][-1] > cols['MACD_Signal'][-1]
+        hist_up = cols['MACD_Hist'][-1] > cols['MACD_Hist'][-2]
+        hist_down = cols['MACD_Hist'][-1] < cols['MACD_Hist'][-2]
+        ma5, ma20, ma60 = cols['MA5'][-1], cols['MA20'][-1], cols['MA60'][-1]
+        stoch_k, stoch_d = cols['Stoch_K'][-1], cols['Stoch_D'][-1]
+        adx_strong = cols['ADX'][-1] > 25
+        obv_last, obv_ma_last = cols['OBV'][-1], cols['OBV_MA'][-1]
+        close = cols['close'][-1]
+        span_a, span_b = cols['Ichimoku_SpanA'][-1], cols['Ichimoku_SpanB'][-1]
+
+        # if/elif 체인 대신 규칙 전체를 불리언 벡터로 평가해 가중치와 내적
+        conditions = np.array([
+            rsi < 30,                                            # RSI 과매도
+            rsi > 70,                                            # RSI 과매수
+            macd_up and hist_up,                                 # MACD 상승 강화
+            macd_up and not hist_up,                             # MACD 상승
+            not macd_up and hist_down,                           # MACD 하락 강화
+            not macd_up and not hist_down,                       # MACD 하락
+            ma5 > ma20 > ma60,                                   # 황금 크로스
+            ma5 < ma20 < ma60,                                   # 데드 크로스
+            current_price < cols['BB_Lower'][-1],                # BB 하단 돌파
+            current_price > cols['BB_Upper'][-1],                # BB 상단 돌파
+            stoch_k < 20 and stoch_k > stoch_d,                  # 스토캐스틱 반등
+            stoch_k > 80 and stoch_k < stoch_d,                  # 스토캐스틱 하락
+            adx_strong and cols['DI_plus'][-1] > cols['DI_minus'][-1],   # DMI 상승
+            adx_strong and cols['DI_minus'][-1] > cols['DI_plus'][-1],   # DMI 하락
+            obv_last > obv_ma_last,                              # OBV 상승
+            obv_last < obv_ma_last,                              # OBV 하락
+            close > span_a and close > span_b,                   # 일목 상승
+            close < span_a and close < span_b,                   # 일목 하락
+            cols['ROC'][-1] > 5,                                 # ROC 상승 모멘텀
+            cols['ROC'][-1] < -5,                                # ROC 하락 모멘텀
+            current_price >= cols['Upper_Channel'][-1],          # 상단 채널 돌파
+            current_price <= cols['Lower_Channel'][-1],          # 하단 채널 돌파
+        ], dtype=bool)
+
+        result['signals'] = [_SIGNAL_MESSAGES[i] for i in np.flatnonzero(conditions)]
+        result['signal_strength'] = int((conditions.astype(np.int8) * _SIGNAL_WEIGHTS).sum())
         return result
 
 def get_top_volume_tickers():
     """거래대금 상위 코인 조회"""
     try:
         tickers = pyupbit.get_tickers(fiat="KRW")
-        markets = None
-        for _ in range(3):  # 최대 3번 재시도
-            try:
-                markets = pyupbit.get_current_price(tickers)
-                if markets is not None:
-                    break
-                time.sleep(0.5)
-            except Exception:
-                time.sleep(0.5)
-        
-        if markets is None:
-            return []
-        
-        volume_data = []
-        for ticker in tickers:
-            try:
-                daily_data = None
-                for _ in range(3):  # 최대 3번 재시도
-                    try:
-                        daily_data = pyupbit.get_ohlcv(ticker, interval="day", count=1)
-                        if daily_data is not None and not daily_data.empty:
-                            break
-                        time.sleep(0.5)
-                    except Exception:
-                        time.sleep(0.5)
-                
-                if daily_data is not None and not daily_data.empty:
-                    volume = daily_data['volume'].iloc[-1] * daily_data['close'].iloc[-1]
-                    volume_data.append((ticker, volume))
-            except Exception:
-                continue
-            time.sleep(0.1)  # API 호출 간격 조절
-        
+
+        # /v1/ticker는 전 종목을 한 번에 받으므로 티커별 왕복이 필요 없다
+        response = requests.get(
+            "https://api.upbit.com/v1/ticker",
+            params={"markets": ",".join(tickers)},
+            timeout=5,
+        )
+        response.raise_for_status()
+
+        volume_data = [(row['market'], row['acc_trade_price_24h']) for row in response.json()]
         volume_data.sort(key=lambda x: x[1], reverse=True)
         return [item[0] for item in volume_data[:3]]
     except Exception as e:
         print(f"거래대금 상위 코인 조회 중 오류 발생: {e}")
         return []
 
+def warmup_analyzers(analyzers, interval="minute60", count=200):
+    """워밍업 전인 분석기들을 (티커 수 x 봉 수) 배치로 한 번에 준비
+
+    티커마다 융합 커널을 따로 돌리는 대신 종가/고가/저가를 2-D 배열로
+    쌓아 _fused_rolling_batch 한 번으로 계산한 뒤 각 분석기에 돌려준다.
+    """
+    cold = [analyzer for analyzer in analyzers.values() if analyzer.df is None]
+    if len(cold) < 2:
+        return  # 티커가 하나면 단일 커널 경로가 처리
+
+    def fetch(analyzer):
+        try:
+            # 디스크 캐시가 살아 있으면 부족분만 받고, 없을 때만 전체 요청
+            cached = analyzer._load_cached_ohlcv(interval, count)
+            if cached is not None:
+                return cached
+            return pyupbit.get_ohlcv(analyzer.ticker, interval=interval, count=count)
+        except Exception:
+            return None
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        dfs = list(executor.map(fetch, cold))
+
+    pairs = [(analyzer, df) for analyzer, df in zip(cold, dfs)
+             if df is not None and len(df) == count]
+    if not pairs:
+        return
+
+    closes = np.stack([df['close'].to_numpy(np.float64) for _, df in pairs])
+    highs = np.stack([df['high'].to_numpy(np.float64) for _, df in pairs])
+    lows = np.stack([df['low'].to_numpy(np.float64) for _, df in pairs])
+    batch = _fused_rolling_batch(closes, highs, lows)
+
+    for (analyzer, df), rolled in zip(pairs, batch):
+        try:
+            analyzer._warmup(interval=interval, count=count, df=df, rolled=rolled)
+        except Exception as e:
+            print(f"{analyzer.ticker} 워밍업 중 오류 발생: {e}")
+
 def print_analysis_result(result):
-    """분석 결과 출력"""
+    """분석 결과 출력 (리포트 전체를 모아 한 번에 stdout에 쓴다)"""
     if result is None:
         return
-    
-    print(f"\n{result['ticker']} 분석 리포트")
-    print("="*50)
-    print(f"현재 가격: {result['current_price']:,}원")
-    
+
+    out = []
+    out.append(f"\n{result['ticker']} 분석 리포트")
+    out.append("="*50)
+    out.append(f"현재 가격: {result['current_price']:,}원")
+
     # 주요 기술적 지표 값 출력
-    print("\n📊 주요 지표 현황:")
-    print(f"RSI: {result['rsi']:.2f}")
+    out.append("\n📊 주요 지표 현황:")
+    out.append(f"RSI: {result['rsi']:.2f}")
     if result['rsi'] > 70:
-        print("   ⚠️ 과매수 구간 - 조정 가능성 높음")
+        out.append("   ⚠️ 과매수 구간 - 조정 가능성 높음")
     elif result['rsi'] < 30:
-        print("   💡 과매도 구간 - 반등 가능성 높음")
-            
-    print(f"\n이동평균선:")
-    print(f"MA5: {result['ma5']:.0f}")
-    print(f"MA20: {result['ma20']:.0f}")
-    print(f"MA60: {result['ma60']:.0f}")
-        
+        out.append("   💡 과매도 구간 - 반등 가능성 높음")
+
+    out.append(f"\n이동평균선:")
+    out.append(f"MA5: {result['ma5']:.0f}")
+    out.append(f"MA20: {result['ma20']:.0f}")
+    out.append(f"MA60: {result['ma60']:.0f}")
+
     if result['ma5'] > result['ma20'] > result['ma60']:
-        print("   💹 단기/중기/장기 모두 상승 트렌드")
+        out.append("   💹 단기/중기/장기 모두 상승 트렌드")
     elif result['ma5'] < result['ma20'] < result['ma60']:
-        print("   📉 단기/중기/장기 모두 하락 트렌드")
-        
-    print("\n🔍 상세 분석:")
-    for signal in result['signals']:
-        print(signal)
-        
-    print("\n💡 트레이딩 전략 추천:")
+        out.append("   📉 단기/중기/장기 모두 하락 트렌드")
+
+    out.append("\n🔍 상세 분석:")
+    out.extend(result['signals'])
+
+    out.append("\n💡 트레이딩 전략 추천:")
     signal_strength = result['signal_strength']
     if signal_strength >= 3:
-        print("""적극적 매수 구간 🚀
+        out.append("""적극적 매수 구간 🚀
 - 강력한 상승 추세 확인
 - 추가 상승 여력 높음
 - 분할 매수 전략 추천""")
     elif signal_strength == 2:
-        print("""매수 고려 구간 ⭐
+        out.append("""매수 고려 구간 ⭐
 - 상승 추세 진입 단계
 - 리스크 분산을 위해 분할 매수 권장
 - 추가 확인 후 매수 결정""")
     elif signal_strength == 1:
-        print("""관망 후 매수 고려 💭
+        out.append("""관망 후 매수 고려 💭
 - 상승 가능성 있으나 신중한 접근 필요
 - 추가 지표 확인 필요
 - 소액 분할 매수 검토""")
     elif signal_strength == 0:
-        print("""중립 구간 ⚖️
+        out.append("""중립 구간 ⚖️
 - 뚜렷한 추세 없음
 - 적극적 매매 지양
 - 추가 모니터링 필요""")
     elif signal_strength == -1:
-        print("""관망 후 매도 고려 💭
+        out.append("""관망 후 매도 고려 💭
 - 하락 가능성 있으나 신중한 접근 필요
 - 추가 지표 확인 필요
 - 일부 수익 실현 검토""")
     elif signal_strength == -2:
-        print("""매도 고려 구간 ⚠️
+        out.append("""매도 고려 구간 ⚠️
 - 하락 추세 진입 단계
 - 수익 실현 권장
 - 리스크 관리 필요""")
     else:
-        print("""적극적 매도 구간 🔥
+        out.append("""적극적 매도 구간 🔥
 - 강력한 하락 추세 확인
 - 추가 하락 가능성 높음
 - 빠른 손절 추천""")
 
     # 추가 분석 코멘트
-    print("\n📈 추세 분석:")
+    out.append("\n📈 추세 분석:")
     if 'Stoch_K' in result and 'Stoch_D' in result:
         if result['Stoch_K'] < 20:
-            print("- 스토캐스틱: 과매도 구간, 반등 가능성 있음")
+            out.append("- 스토캐스틱: 과매도 구간, 반등 가능성 있음")
         elif result['Stoch_K'] > 80:
-            print("- 스토캐스틱: 과매수 구간, 조정 가능성 있음")
-        
+            out.append("- 스토캐스틱: 과매수 구간, 조정 가능성 있음")
+
     if 'ADX' in result:
         if result['ADX'] > 25:
             if result['DI_plus'] > result['DI_minus']:
-                print("- DMI: 강력한 상승 추세 진행 중")
+                out.append("- DMI: 강력한 상승 추세 진행 중")
             else:
-                print("- DMI: 강력한 하락 추세 진행 중")
+                out.append("- DMI: 강력한 하락 추세 진행 중")
         else:
-            print("- DMI: 뚜렷한 추세 없음")
-        
-    print("\n💰 거래량 분석:")
+            out.append("- DMI: 뚜렷한 추세 없음")
+
+    out.append("\n💰 거래량 분석:")
     if 'OBV' in result:
         if result['OBV'] > result.get('OBV_MA', 0):
-            print("- OBV: 매수세 우위, 상승 추세 지속 가능성 높음")
+            out.append("- OBV: 매수세 우위, 상승 추세 지속 가능성 높음")
         else:
-            print("- OBV: 매도세 우위, 하락 추세 지속 가능성 높음")
-        
-    print("\n⚡ 단기 매매 전략:")
+            out.append("- OBV: 매도세 우위, 하락 추세 지속 가능성 높음")
+
+    out.append("\n⚡ 단기 매매 전략:")
     if signal_strength > 0:
-        print("""- 지지선: 이동평균선과 일목균형표 구름대 활용
+        out.append("""- 지지선: 이동평균선과 일목균형표 구름대 활용
 - 손절가: 최근 저점 아래로 하락 시
 - 목표가: 이전 고점 또는 상단 채널 라인""")
     elif signal_strength < 0:
-        print("""- 저항선: 이동평균선과 일목균형표 구름대 활용
+        out.append("""- 저항선: 이동평균선과 일목균형표 구름대 활용
 - 손절가: 최근 고점 위로 상승 시
 - 목표가: 이전 저점 또는 하단 채널 라인""")
-        
-    print("\n⚠️ 리스크 관리:")
-    print("- 투자금의 1-2% 이상 손실 시 손절 권장")
-    print("- 분할 매매로 리스크 분산")
-    print("- 추세 전환 시 즉시 대응 필요")
-        
-    print("\n=== 분석 완료 ===")
+
+    out.append("\n⚠️ 리스크 관리:")
+    out.append("- 투자금의 1-2% 이상 손실 시 손절 권장")
+    out.append("- 분할 매매로 리스크 분산")
+    out.append("- 추세 전환 시 즉시 대응 필요")
+
+    out.append("\n=== 분석 완료 ===")
+    sys.stdout.write('\n'.join(out) + '\n')
 
 def main():
     base_tickers = ["KRW-BTC", "KRW-DOGE"]
@@ -487,7 +911,8 @@ def main():
     
     while True:
         try:
-            current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            # 루프당 한 번만 시각을 찍어서 재사용 (strftime은 생각보다 비싸다)
+            current_time = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime())
             print(f"\n[{current_time}] 분석 시작")
             print("="*70)
             
@@ -500,18 +925,25 @@ def main():
             for ticker in top_tickers:
                 if ticker not in analyzers:
                     analyzers[ticker] = CryptoAnalyzer(ticker)
+
+            # 워밍업 전인 코인들은 배치 커널로 한 번에 준비
+            warmup_analyzers(analyzers)
             
-            # 모든 코인 분석
-            for ticker, analyzer in analyzers.items():
-                try:
-                    result = analyzer.analyze_signals()
-                    if result is not None:
-                        print_analysis_result(result)
-                        print("-"*70)
-                    else:
-                        print(f"{ticker} 분석 실패")
-                except Exception as e:
-                    print(f"{ticker} 분석 중 오류 발생: {e}")
+            # 모든 코인 분석 (I/O 대기가 대부분이라 스레드 풀로 동시 실행)
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                futures = {executor.submit(analyzer.analyze_signals): ticker
+                           for ticker, analyzer in analyzers.items()}
+                for future in as_completed(futures):
+                    ticker = futures[future]
+                    try:
+                        result = future.result()
+                        if result is not None:
+                            print_analysis_result(result)
+                            print("-"*70)
+                        else:
+                            print(f"{ticker} 분석 실패")
+                    except Exception as e:
+                        print(f"{ticker} 분석 중 오류 발생: {e}")
             
             time.sleep(15)
             
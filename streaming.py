@@ -0,0 +1,294 @@
+"""스트리밍(증분) 기술적 지표
+
+200봉 전체를 15초마다 다시 계산하는 대신, 새로 확정된 봉 하나를 O(1)로
+반영하기 위한 상태 보존형 지표 모음. 각 클래스의 update()는 새 값을 받아
+최신 지표 값을 돌려주며, 워밍업이 끝나기 전에는 nan을 돌려준다.
+"""
+
+import math
+from collections import deque
+
+_NAN = float('nan')
+
+
+class StreamingSMA:
+    """단순 이동평균: 슬라이딩 합으로 O(1) 갱신"""
+
+    def __init__(self, window):
+        self.window = window
+        self._buf = deque(maxlen=window)
+        self._sum = 0.0
+
+    def update(self, value):
+        if len(self._buf) == self.window:
+            self._sum -= self._buf[0]
+        self._buf.append(value)
+        self._sum += value
+        if len(self._buf) < self.window:
+            return _NAN
+        return self._sum / self.window
+
+
+class StreamingEMA:
+    """지수 이동평균: 첫 window개 평균으로 시딩 후 O(1) 갱신"""
+
+    def __init__(self, window):
+        self.window = window
+        self._alpha = 2.0 / (window + 1)
+        self._seed = []
+        self._value = None
+
+    def update(self, value):
+        if self._value is None:
+            self._seed.append(value)
+            if len(self._seed) < self.window:
+                return _NAN
+            self._value = sum(self._seed) / self.window
+        else:
+            self._value += self._alpha * (value - self._value)
+        return self._value
+
+
+class StreamingMax:
+    """rolling max: 단조 감소 데크로 amortized O(1)"""
+
+    def __init__(self, window):
+        self.window = window
+        self._deque = deque()  # (순번, 값)
+        self._i = 0
+
+    def update(self, value):
+        dq = self._deque
+        while dq and dq[-1][1] <= value:
+            dq.pop()
+        dq.append((self._i, value))
+        if dq[0][0] <= self._i - self.window:
+            dq.popleft()
+        self._i += 1
+        if self._i < self.window:
+            return _NAN
+        return dq[0][1]
+
+
+class StreamingMin:
+    """rolling min: 단조 증가 데크로 amortized O(1)"""
+
+    def __init__(self, window):
+        self.window = window
+        self._deque = deque()
+        self._i = 0
+
+    def update(self, value):
+        dq = self._deque
+        while dq and dq[-1][1] >= value:
+            dq.pop()
+        dq.append((self._i, value))
+        if dq[0][0] <= self._i - self.window:
+            dq.popleft()
+        self._i += 1
+        if self._i < self.window:
+            return _NAN
+        return dq[0][1]
+
+
+class StreamingRSI:
+    """RSI: Wilder 평활 게인/로스를 상태로 유지"""
+
+    def __init__(self, window=14):
+        self.window = window
+        self._prev = None
+        self._count = 0
+        self._avg_gain = 0.0
+        self._avg_loss = 0.0
+
+    def update(self, close):
+        if self._prev is None:
+            self._prev = close
+            return _NAN
+        diff = close - self._prev
+        self._prev = close
+        gain = diff if diff > 0 else 0.0
+        loss = -diff if diff < 0 else 0.0
+        w = self.window
+        if self._count < w:
+            self._avg_gain += gain / w
+            self._avg_loss += loss / w
+            self._count += 1
+            if self._count < w:
+                return _NAN
+        else:
+            self._avg_gain = (self._avg_gain * (w - 1) + gain) / w
+            self._avg_loss = (self._avg_loss * (w - 1) + loss) / w
+        if self._avg_loss == 0.0:
+            return 100.0
+        rs = self._avg_gain / self._avg_loss
+        return 100.0 - 100.0 / (1.0 + rs)
+
+
+class StreamingMACD:
+    """MACD: 빠른/느린/시그널 EMA 세 개의 상태만 유지"""
+
+    def __init__(self, fast=12, slow=26, signal=9):
+        self._fast = StreamingEMA(fast)
+        self._slow = StreamingEMA(slow)
+        self._signal = StreamingEMA(signal)
+
+    def update(self, close):
+        fast = self._fast.update(close)
+        slow = self._slow.update(close)
+        if math.isnan(fast) or math.isnan(slow):
+            return _NAN, _NAN, _NAN
+        macd = fast - slow
+        signal = self._signal.update(macd)
+        return macd, signal, macd - signal
+
+
+class StreamingBBands:
+    """볼린저 밴드: 슬라이딩 합/제곱합으로 O(1) 갱신"""
+
+    def __init__(self, window=20, num_dev=2.0):
+        self.window = window
+        self.num_dev = num_dev
+        self._buf = deque(maxlen=window)
+        self._sum = 0.0
+        self._sumsq = 0.0
+
+    def update(self, close):
+        if len(self._buf) == self.window:
+            old = self._buf[0]
+            self._sum -= old
+            self._sumsq -= old * old
+        self._buf.append(close)
+        self._sum += close
+        self._sumsq += close * close
+        if len(self._buf) < self.window:
+            return _NAN, _NAN, _NAN
+        mean = self._sum / self.window
+        var = self._sumsq / self.window - mean * mean
+        std = math.sqrt(var) if var > 0.0 else 0.0
+        return mean, mean + std * self.num_dev, mean - std * self.num_dev
+
+
+class StreamingStoch:
+    """스토캐스틱 slow %K/%D"""
+
+    def __init__(self, window=14, smooth_k=3, smooth_d=3):
+        self._high = StreamingMax(window)
+        self._low = StreamingMin(window)
+        self._k_sma = StreamingSMA(smooth_k)
+        self._d_sma = StreamingSMA(smooth_d)
+
+    def update(self, high, low, close):
+        hh = self._high.update(high)
+        ll = self._low.update(low)
+        if math.isnan(hh) or math.isnan(ll):
+            return _NAN, _NAN
+        rng = hh - ll
+        fast_k = 50.0 if rng == 0.0 else (close - ll) / rng * 100.0
+        slow_k = self._k_sma.update(fast_k)
+        if math.isnan(slow_k):
+            return _NAN, _NAN
+        return slow_k, self._d_sma.update(slow_k)
+
+
+class StreamingADX:
+    """ADX/+DI/-DI: Wilder 평활 TR/+DM/-DM을 상태로 유지"""
+
+    def __init__(self, window=14):
+        self.window = window
+        self._prev = None  # (high, low, close)
+        self._count = 0
+        self._tr = 0.0
+        self._plus_dm = 0.0
+        self._minus_dm = 0.0
+        self._dx_count = 0
+        self._dx_sum = 0.0
+        self._adx = None
+
+    def update(self, high, low, close):
+        if self._prev is None:
+            self._prev = (high, low, close)
+            return _NAN, _NAN, _NAN
+        ph, pl, pc = self._prev
+        self._prev = (high, low, close)
+        tr = max(high - low, abs(high - pc), abs(low - pc))
+        up = high - ph
+        down = pl - low
+        plus_dm = up if (up > down and up > 0) else 0.0
+        minus_dm = down if (down > up and down > 0) else 0.0
+        w = self.window
+        if self._count < w:
+            self._tr += tr
+            self._plus_dm += plus_dm
+            self._minus_dm += minus_dm
+            self._count += 1
+            if self._count < w:
+                return _NAN, _NAN, _NAN
+        else:
+            self._tr = self._tr - self._tr / w + tr
+            self._plus_dm = self._plus_dm - self._plus_dm / w + plus_dm
+            self._minus_dm = self._minus_dm - self._minus_dm / w + minus_dm
+        if self._tr == 0.0:
+            di_plus = di_minus = 0.0
+        else:
+            di_plus = 100.0 * self._plus_dm / self._tr
+            di_minus = 100.0 * self._minus_dm / self._tr
+        di_sum = di_plus + di_minus
+        dx = 0.0 if di_sum == 0.0 else 100.0 * abs(di_plus - di_minus) / di_sum
+        if self._adx is None:
+            self._dx_sum += dx
+            self._dx_count += 1
+            if self._dx_count < w:
+                return _NAN, di_plus, di_minus
+            self._adx = self._dx_sum / w
+        else:
+            self._adx = (self._adx * (w - 1) + dx) / w
+        return self._adx, di_plus, di_minus
+
+
+class StreamingOBV:
+    """OBV: 직전 종가와 누적 합만 유지"""
+
+    def __init__(self):
+        self._prev_close = None
+        self._obv = 0.0
+
+    def update(self, close, volume):
+        if self._prev_close is None:
+            self._obv = volume  # TA-Lib OBV는 첫 봉 거래량으로 시작
+        elif close > self._prev_close:
+            self._obv += volume
+        elif close < self._prev_close:
+            self._obv -= volume
+        self._prev_close = close
+        return self._obv
+
+
+class StreamingForceIndex:
+    """Force Index: (종가 변화량 x 거래량)의 EMA"""
+
+    def __init__(self, window=13):
+        self._ema = StreamingEMA(window)
+        self._prev_close = None
+
+    def update(self, close, volume):
+        if self._prev_close is None:
+            self._prev_close = close
+            return _NAN
+        fi = (close - self._prev_close) * volume
+        self._prev_close = close
+        return self._ema.update(fi)
+
+
+class StreamingROC:
+    """ROC: window+1 길이 원형 버퍼로 O(1) 갱신"""
+
+    def __init__(self, window=10):
+        self.window = window
+        self._buf = deque(maxlen=window + 1)
+
+    def update(self, close):
+        self._buf.append(close)
+        if len(self._buf) <= self.window:
+            return _NAN
+        return (close / self._buf[0] - 1.0) * 100.0